@@ -0,0 +1,55 @@
+import argparse
+import timeit
+
+from main import ConfigParser, ConfigParserSession
+
+
+def generate_config(blocks, entries):
+    lines = ["def PORT := 5432", "def HOST := localhost", ""]
+    for i in range(blocks):
+        lines.append(f"service_{i} -> {{")
+        lines.append("    port -> @[PORT].")
+        for j in range(entries):
+            lines.append(f"    key_{j} -> value_{i}_{j}.")
+        lines.append("    nested -> {")
+        lines.append("        host -> @[HOST].")
+        lines.append("    }")
+        lines.append("}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full vs incremental reparse benchmark")
+    parser.add_argument("--blocks", type=int, default=2000, help="Number of top-level blocks")
+    parser.add_argument("--entries", type=int, default=10, help="Entries per block")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs")
+    args = parser.parse_args()
+
+    input_text = generate_config(args.blocks, args.entries)
+    # Правка одного блока и правка константы, от которой зависят все блоки.
+    edits = {
+        "single block edit": input_text.replace("value_0_0.", "changed."),
+        "constant edit": input_text.replace("def PORT := 5432", "def PORT := 8080"),
+    }
+
+    print(f"{args.blocks} blocks, {len(input_text.splitlines())} lines")
+    for name, edited_text in edits.items():
+        full = min(timeit.repeat(lambda: ConfigParser().parse(edited_text),
+                                 number=1, repeat=args.repeat))
+
+        session = ConfigParserSession()
+        session.parse(input_text)
+
+        def incremental():
+            session.parse(edited_text)
+            session.parse(input_text)
+
+        incremental_time = min(timeit.repeat(incremental, number=1, repeat=args.repeat)) / 2
+        session.parse(edited_text)
+        print(f"{name}: full {full * 1000:.2f} ms, "
+              f"incremental {incremental_time * 1000:.2f} ms "
+              f"({session.reparsed} segments reparsed)")
+
+
+if __name__ == "__main__":
+    main()
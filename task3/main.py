@@ -1,11 +1,20 @@
 import argparse
 import re
+from collections import ChainMap
 import toml
 import sys
 
 
+CONSTANT_REFERENCE = re.compile(r"@\[([^\]]+)\]")
+NESTED_DICTIONARY = re.compile(r"([_a-zA-Z0-9]+)\s*->\s*{")
+_MISSING = object()
+
+
 class ConfigParser:
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self.constants = {}
         self.current_dict_stack = []
         self.current_key_stack = []
@@ -24,7 +33,7 @@ class ConfigParser:
                 self._start_dictionary()
             elif line == "}":
                 self._end_dictionary()
-            elif re.match(r"[_a-zA-Z0-9]+\s*->\s*{", line):
+            elif NESTED_DICTIONARY.match(line):
                 self._start_nested_dictionary(line)
             elif self._current_dict() is not None:
                 self._add_to_dictionary(line)
@@ -78,7 +87,7 @@ class ConfigParser:
             self.current_parsed_dict.update(current_dict)
 
     def _start_nested_dictionary(self, line):
-        match = re.match(r"([_a-zA-Z0-9]+)\s*->\s*{", line)
+        match = NESTED_DICTIONARY.match(line)
         if not match:
             raise SyntaxError(f"Invalid syntax: {line}")
         key = match.group(1)
@@ -97,6 +106,116 @@ class ConfigParser:
             self._current_dict()[key] = self._evaluate_value(value)
 
 
+class ConfigParserSession:
+    """Переиспользуемая сессия парсера для повторного разбора изменённого текста.
+
+    Текст делится на верхнеуровневые сегменты: строки ``def`` и блоки
+    словарей. Результат каждого сегмента кэшируется вместе со значениями
+    констант, на которые он ссылается, поэтому при очередном вызове
+    ``parse`` заново разбираются только изменённые сегменты и сегменты,
+    зависящие от изменившихся ``@[CONST]``.
+
+    Возвращаемый результат не связан с кэшем и может свободно изменяться.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._cache = {}
+        self.reparsed = 0
+
+    def parse(self, input_text):
+        constants = {}
+        parsed_dict = {}
+        cache = {}
+        self.reparsed = 0
+
+        for segment in self._split_segments(input_text):
+            # Одинаковые сегменты могут разбираться при разных значениях констант.
+            entries = self._cache.get(segment, [])
+            entry = next(
+                (entry for entry in entries if self._is_fresh(entry, constants)),
+                None,
+            )
+            if entry is None:
+                entry = self._parse_segment(segment, constants)
+                self.reparsed += 1
+
+            entries = cache.setdefault(segment, [])
+            if entry not in entries:
+                entries.append(entry)
+
+            _, defined, fragment = entry
+            constants.update(defined)
+            parsed_dict.update(self._copy_dict(fragment))
+
+        self._cache = cache
+        return parsed_dict
+
+    @staticmethod
+    def _split_segments(input_text):
+        segments = []
+        current = []
+        depth = 0
+        for line in input_text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            # Глубина повторяет размер стека словарей ConfigParser.
+            if line == "{":
+                depth += 2 if depth else 1
+            elif line == "}":
+                if depth <= 0:
+                    raise SyntaxError("No dictionary to close.")
+                depth -= 1
+            elif "{" in line and NESTED_DICTIONARY.match(line):
+                depth += 1
+            elif not current and not line.startswith("def "):
+                continue
+
+            current.append(line)
+            if depth == 0:
+                segments.append("\n".join(current))
+                current = []
+
+        if current:
+            raise SyntaxError("Unclosed dictionary detected.")
+
+        return segments
+
+    @staticmethod
+    def _is_fresh(entry, constants):
+        dependencies = entry[0]
+        return all(
+            constants.get(name, _MISSING) == value
+            for name, value in dependencies.items()
+        )
+
+    @staticmethod
+    def _parse_segment(segment, constants):
+        # Новые константы попадают в первый словарь ChainMap, поэтому сегмент
+        # экспортирует все присвоенные им имена, даже с прежним значением.
+        parser = ConfigParser()
+        parser.constants = ChainMap({}, constants)
+        fragment = parser.parse(segment)
+
+        dependencies = {
+            name: constants.get(name, _MISSING)
+            for name in CONSTANT_REFERENCE.findall(segment)
+        }
+        defined = parser.constants.maps[0]
+        return dependencies, defined, fragment
+
+    @classmethod
+    def _copy_dict(cls, source):
+        return {
+            key: cls._copy_dict(value) if isinstance(value, dict) else value
+            for key, value in source.items()
+        }
+
+
 def main():
     parser = argparse.ArgumentParser(description="CLI Config Language Parser")
     parser.add_argument("input_file", help="Path to the input file")
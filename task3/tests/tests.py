@@ -1,6 +1,6 @@
 import unittest
 from io import StringIO
-from main import ConfigParser
+from main import ConfigParser, ConfigParserSession
 
 
 class TestConfigParser(unittest.TestCase):
@@ -88,5 +88,95 @@ class TestConfigParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             parser.parse(input_text)
 
+
+class TestConfigParserSession(unittest.TestCase):
+    input_text = """
+        def PORT := 5432
+        server -> {
+            port -> @[PORT].
+            host -> localhost.
+        }
+        client -> {
+            user -> admin.
+        }
+    """
+
+    def test_matches_full_parse(self):
+        """Тест совпадения результата сессии с полным парсингом"""
+        session = ConfigParserSession()
+        self.assertEqual(session.parse(self.input_text),
+                         ConfigParser().parse(self.input_text))
+
+    def test_reparse_only_changed_block(self):
+        """Тест повторного разбора только изменённого блока"""
+        session = ConfigParserSession()
+        session.parse(self.input_text)
+        self.assertEqual(session.reparsed, 3)
+
+        result = session.parse(self.input_text.replace("admin", "root"))
+        self.assertEqual(session.reparsed, 1)
+        self.assertEqual(result["client"], {"user": "root"})
+        self.assertEqual(result["server"], {"port": 5432, "host": "localhost"})
+
+    def test_reparse_dependent_block(self):
+        """Тест повторного разбора блоков, зависящих от изменённой константы"""
+        session = ConfigParserSession()
+        session.parse(self.input_text)
+
+        result = session.parse(self.input_text.replace("5432", "8080"))
+        self.assertEqual(session.reparsed, 2)
+        self.assertEqual(result["server"]["port"], 8080)
+
+    def test_reset(self):
+        """Тест сброса сессии"""
+        session = ConfigParserSession()
+        session.parse(self.input_text)
+        session.reset()
+        session.parse(self.input_text)
+        self.assertEqual(session.reparsed, 3)
+
+    def test_edits_match_full_parse(self):
+        """Тест совпадения результата сессии с полным парсингом после правок"""
+        block = "client -> {\n    user -> admin.\n}"
+        edits = [
+            self.input_text,
+            self.input_text + "\nextra -> {\n    v -> 1.\n}",
+            self.input_text.replace(block, ""),
+            self.input_text + "\ndef PORT := 8080\nlate -> {\n    port -> @[PORT].\n}",
+            "def PORT := 1\n" + self.input_text,
+            "def PORT := 5432\n{\n    def HOST := db\n}\na -> {\n    host -> @[HOST].\n}",
+            self.input_text + "\n" + block + "\n" + block,
+            "def X := 5\ndef X := 5\na -> {\n  v -> @[X].\n}",
+            "def X := 5\na -> {\n  v -> @[X].\n}",
+            "def X := 1\na -> {\n  v -> @[X].\n}\ndef X := 2\na -> {\n  v -> @[X].\n}",
+            "def X := 2\na -> {\n  v -> @[X].\n}",
+        ]
+        session = ConfigParserSession()
+        for _ in range(2):
+            for text in edits:
+                with self.subTest(text=text):
+                    self.assertEqual(session.parse(text), ConfigParser().parse(text))
+
+    def test_delete_earlier_definition(self):
+        """Тест удаления первого из повторных определений константы"""
+        text = "def X:=5\ndef X := 5\na -> {\n  v -> @[X].\n}"
+        session = ConfigParserSession()
+        session.parse(text)
+        edited_text = text.split("\n", 1)[1]
+        self.assertEqual(session.parse(edited_text), ConfigParser().parse(edited_text))
+
+    def test_result_is_not_shared_with_cache(self):
+        """Тест независимости результата от кэша сессии"""
+        session = ConfigParserSession()
+        result = session.parse(self.input_text)
+        result["server"]["port"] = 99
+        self.assertEqual(session.parse(self.input_text)["server"]["port"], 5432)
+
+    def test_unclosed_braces(self):
+        """Тест на незакрытые скобки в сессии"""
+        session = ConfigParserSession()
+        with self.assertRaises(SyntaxError):
+            session.parse("test -> {\n    server -> 8080.\n")
+
 if __name__ == "__main__":
     unittest.main()